@@ -1,18 +1,268 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter, Retry
+from lxml import etree
+import numpy as np
+import concurrent.futures
+import hashlib
 import json
 import os
+import pathlib
+import re
+import sys
+import threading
+import time
+
+try:
+    import orjson  # C serializer, ~5-10x faster than stdlib json
+except ImportError:
+    orjson = None  # fall back to the stdlib writer below
+
+# All ORC club certificates live under the same endpoint, keyed by id
+BASE_URL = "https://data.orc.org/public/WPub.dll/CC/{cert_id}"
+
+# On-disk cache for fetched pages. A certificate rarely changes within a
+# day, so repeat runs skip HTTP entirely and re-parse from local disk.
+_CACHE_DIR = pathlib.Path(".cache/html")
+_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# ------------------------------------------------------------------
+# One shared HTTP session for the whole module. Keep-alive means we
+# pay TCP+TLS setup once per host instead of once per certificate,
+# which is what dominates wall time when scraping many boats.
+# ------------------------------------------------------------------
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "orc-scraper/1.0"})
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+_SESSION.mount("https://", _adapter)
+_SESSION.mount("http://", _adapter)
+
+# ------------------------------------------------------------------
+# Compiled XPath expressions, built once at import time.
+# Compiling is not free, so we pay it here instead of on every call
+# (the parse_* functions run once per certificate). Convention: every
+# selector the parsers use lives here as a module-level constant —
+# don't call .xpath()/.findall() with string literals inside the
+# parse_* functions, or the expression gets recompiled per document.
+# Class matching uses the token form so multi-class attributes like
+# class="data number" still match.
+# ------------------------------------------------------------------
+def _has_class(cls):
+    """XPath predicate matching `cls` as one token of the class attribute."""
+    return "contains(concat(' ', normalize-space(@class), ' '), ' %s ')" % cls
+
+# Every top-level section extract_all cares about, collected in one
+# document-order pass (the per-section full-tree scans are gone)
+_XP_SECTIONS      = etree.XPath(
+    "//div[%s or %s or %s or %s] | //table[%s or %s]" % (
+        _has_class("cert-type"), _has_class("right-column"),
+        _has_class("p2group"), _has_class("sailsGroup"),
+        _has_class("boatspeeds"), _has_class("allowances"),
+    )
+)
+_XP_INNER_DIV     = etree.XPath(".//div")
+_XP_INNER_H1      = etree.XPath(".//h1")
+_XP_STRONGS       = etree.XPath(".//strong")
+# Text of a subtree minus anything inside <strong> (used to read the
+# certificate type without picking up the year)
+_XP_NON_STRONG_TEXT = etree.XPath(".//text()[not(ancestor::strong)]")
+_XP_SPANS         = etree.XPath(".//span")
+
+_XP_TABULAR1      = etree.XPath(".//div[%s]" % _has_class("tabular1"))
+# Labels and values of the tabular1 summary block, in document order
+_XP_SUMMARY_SPANS = etree.XPath(".//span[%s or %s]"
+                                % (_has_class("small-label"), _has_class("data")))
+_XP_P1GROUPS      = etree.XPath("./div[%s]" % _has_class("p1group"))
+_XP_TITLE_SPAN    = etree.XPath(".//span[%s]" % _has_class("title"))
+# A p1group carries exactly one of the tabular2/3/5 flavours; one union
+# expression finds whichever is present in a single subtree walk.
+_XP_TABULAR_ANY   = etree.XPath(".//div[%s or %s or %s]" % tuple(
+    _has_class(c) for c in ("tabular2", "tabular3", "tabular5")))
+_XP_LABEL_SPANS   = etree.XPath(".//span[%s]" % _has_class("label"))
+_XP_DATA_SPANS    = etree.XPath(".//span[%s]" % _has_class("data"))
+
+_XP_ROWS          = etree.XPath(".//tr")
+_XP_TITLE_ROWS    = etree.XPath(".//tr[%s]" % _has_class("title"))
+_XP_DATA_ROWS     = etree.XPath(".//tr[%s]" % _has_class("data"))
+_XP_CAPTION       = etree.XPath("./caption")
+_XP_TDS           = etree.XPath("./td")
+_XP_CELLS         = etree.XPath("./th|./td")
+_XP_THS           = etree.XPath("./th")
+
+_XP_TABULAR       = etree.XPath(".//div[%s]" % _has_class("tabular"))
+# p2group fields: the string() form reads the section title directly,
+# and the union returns the label/data *span elements* interleaved in
+# document order, so one C call per group replaces three span walks.
+# Matching elements (not text nodes) matters: an empty
+# <span class="data"></span> still occupies its slot in the pairing,
+# and the sample certificates do have empty values mid-group.
+_XP_P2_TITLE      = etree.XPath("string(.//span[%s])" % _has_class("title"))
+_XP_P2_PAIRS      = etree.XPath(".//span[%s or %s]"
+                                % (_has_class("label"), _has_class("data")))
+_XP_COLTITLES     = etree.XPath(".//span[%s]" % _has_class("coltitle"))
+
+
+# Collapses any run of whitespace to a single space in one C-level scan
+# (cheaper than the split-into-list-and-rejoin idiom it replaced)
+_WS_RE = re.compile(r"\s+")
+
+
+def _text(el, sep=""):
+    """lxml analog of BS4 get_text(strip=True): join the stripped text of
+    every descendant text node, skipping empty pieces."""
+    return sep.join(t for t in (s.strip() for s in el.itertext()) if t)
+
+
+def _cell_text(el):
+    """Text of a table cell. The numeric cells that dominate these tables
+    hold a single text node, so `el.text` answers without walking any
+    descendants; cells that do contain markup fall back to _text()."""
+    if len(el) == 0:
+        return (el.text or "").strip()
+    return _text(el)
+
+
+def _values_matrix(value_rows):
+    """One 2-D float matrix for the numeric cells of a parsed table.
+
+    Structure-of-arrays form: downstream analysis (interpolation,
+    plotting) wants the numbers as an array anyway, so we build it here
+    instead of shipping one dict + list-of-str per row. Unit suffixes
+    like the degree sign on the beat/gybe angle rows are stripped before
+    converting; anything that still isn't numeric becomes NaN.
+    """
+    n_rows = len(value_rows)
+    n_cols = max((len(r) for r in value_rows), default=0)
+    matrix = np.full((n_rows, n_cols), np.nan)
+    for i, row in enumerate(value_rows):
+        for j, cell in enumerate(row):
+            try:
+                matrix[i, j] = float(cell.rstrip("°"))
+            except ValueError:
+                pass
+    return matrix
+
+
+def _classes(el):
+    """Class attribute of `el` as a list of tokens (lxml stores it as one string)."""
+    return (el.get("class") or "").split()
+
+
+_THREAD_LOCAL = threading.local()
+
+def _html_parser():
+    """The HTMLParser for the current worker thread.
+
+    Parser objects are reusable but not thread-safe, so each thread in
+    main()'s pool gets its own instead of building one per fetch. No
+    encoding is forced: lxml sniffs it from the raw bytes, which is why
+    the fetch path never decodes the page to str at all.
+    """
+    parser = getattr(_THREAD_LOCAL, "html_parser", None)
+    if parser is None:
+        parser = _THREAD_LOCAL.html_parser = etree.HTMLParser()
+    return parser
+
+
+def fetch_tree(url: str):
+    """Fetch `url` and parse it, going through the on-disk cache.
+
+    The page is streamed chunk by chunk to `.cache/html/<blake2b(url)>`
+    and lxml parses straight from the file, so it is never materialized
+    as one big Python str (the old fetch_html path decoded the full
+    payload to text and then re-parsed it — two passes plus a page-sized
+    intermediate allocation). While the cached copy is younger than
+    _CACHE_TTL, repeat runs skip the HTTP round-trip entirely.
+    """
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_file = _CACHE_DIR / (hashlib.blake2b(url.encode()).hexdigest() + ".html")
+    try:
+        fresh = time.time() - cache_file.stat().st_mtime < _CACHE_TTL
+    except OSError:
+        fresh = False
+
+    if not fresh:
+        with _SESSION.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            # write-then-rename so a failed download never leaves a
+            # half-written page behind for the next run to parse
+            tmp_file = cache_file.with_suffix(".tmp")
+            with open(tmp_file, "wb") as f:
+                for chunk in response.iter_content(64 * 1024):
+                    f.write(chunk)
+            tmp_file.replace(cache_file)
+
+    return etree.parse(str(cache_file), _html_parser()).getroot()
+
+# ------------------------------------------------------------------
+# Specialized header extractors, generated at runtime.
+# The cert-type header comes in a small, finite set of layouts
+# (structure A wraps the fields in a <div>, structure B in an <h1> —
+# see parse_certificate_type below). Rather than re-branch on the
+# layout for every document, we generate one straight-line extractor
+# per layout the first time we meet it, compile it with exec(), and
+# cache it by fingerprint; all its XPath lookups are precompiled
+# against the detected container tag. Documents with an unrecognized
+# layout fall back to the generic parsers.
+# ------------------------------------------------------------------
+_HEADER_EXTRACTORS = {}
+
+_HEADER_EXTRACTOR_SRC = '''
+def _extract_header(cert_div, boat_div):
+    year = _XP_YEAR(cert_div).strip()
+    raw_text = " ".join(_XP_TYPE_TEXT(cert_div))
+    certificate_type = {
+        "certificate_type": _WS_RE.sub(" ", raw_text).strip(),
+        "year": year,
+    }
+    boatname_sailn = None
+    if boat_div is not None:
+        boat_name = _XP_BOAT_NAME(boat_div).strip()
+        sail_number = _XP_SAIL_NUMBER(boat_div).strip()
+        if boat_name or sail_number:
+            boatname_sailn = {"boat_name": boat_name, "sail_number": sail_number}
+    return certificate_type, boatname_sailn
+'''
+
+
+def _header_fingerprint(cert_div):
+    """Layout of the first cert-type block: its container tag ("div" for
+    structure A, "h1" for structure B), or None if neither is present."""
+    if _XP_INNER_DIV(cert_div):
+        return "div"
+    if _XP_INNER_H1(cert_div):
+        return "h1"
+    return None
+
+
+def _header_extractor(fingerprint):
+    """The compiled header extractor for `fingerprint`, generated on first use."""
+    fn = _HEADER_EXTRACTORS.get(fingerprint)
+    if fn is None:
+        namespace = {
+            "_XP_YEAR": etree.XPath(
+                "string((.//%s)[1]//strong[last()])" % fingerprint),
+            "_XP_TYPE_TEXT": etree.XPath(
+                "(.//%s)[1]//text()[not(ancestor::strong)]" % fingerprint),
+            "_XP_BOAT_NAME": etree.XPath("string((.//strong)[1])"),
+            "_XP_SAIL_NUMBER": etree.XPath("string((.//span)[1])"),
+            "_WS_RE": _WS_RE,
+        }
+        exec(compile(_HEADER_EXTRACTOR_SRC, "<header-extractor>", "exec"), namespace)
+        fn = _HEADER_EXTRACTORS[fingerprint] = namespace["_extract_header"]
+    return fn
 
-def fetch_html(url: str) -> str:
-    """Fetch the raw HTML from the given URL."""
-    response = requests.get(url)
-    response.raise_for_status()
-    return response.text
 
-def parse_certificate_type(soup):
+def parse_certificate_type(cert_div):
     """
+    Generic fallback for cert-type layouts the generated extractor
+    doesn't cover (see _header_extractor above).
+
     Handles both structures:
-    
+
     (A) <div class="cert-type">
           <div>
             <strong></strong>
@@ -20,7 +270,7 @@ def parse_certificate_type(soup):
             <strong>2025</strong>
           </div>
         </div>
-    
+
     (B) <div class="cert-type">
           <h1>
             Club<br><span></span>Certificate<br>
@@ -28,7 +278,10 @@ def parse_certificate_type(soup):
             <strong>2024</strong>
           </h1>
         </div>
-    
+
+    `cert_div` is the first <div class="cert-type"> (located by
+    extract_all's single pass).
+
     Returns:
       {
         "certificate_type": "Club Certificate",
@@ -36,84 +289,56 @@ def parse_certificate_type(soup):
       }
     or None if not found.
     """
-    cert_div = soup.find("div", class_="cert-type")
-    if not cert_div:
-        return None
-
     # Check if there's a <div> or <h1> child
     # We'll pick whichever we find
-    inner_div = cert_div.find("div")  # structure A
-    inner_h1  = cert_div.find("h1")   # structure B
+    inner_divs = _XP_INNER_DIV(cert_div)  # structure A
+    inner_h1s  = _XP_INNER_H1(cert_div)   # structure B
 
-    container = inner_div if inner_div else inner_h1
-    if not container:
+    container = inner_divs[0] if inner_divs else (inner_h1s[0] if inner_h1s else None)
+    if container is None:
         return None
 
     # 1) Find all <strong> children to extract the year from the *last* <strong>.
-    strongs = container.find_all("strong")
+    strongs = _XP_STRONGS(container)
     year_text = ""
     if strongs:
-        year_text = strongs[-1].get_text(strip=True)
-
-    # 2) We'll gather text from the container but *ignore* the last <strong>,
-    #    so we don’t double-count the year in the certificate_type.
-    #    One approach is to temporarily remove the <strong> node from the DOM,
-    #    get text, then revert or just skip it in code.
-
-    # Let's copy the container, remove the strong(s), then get_text().
-    # Or simpler: let's just get_text() from all *non-strong* elements.
-    # We'll also skip script/style, etc.
-
-    # A quick approach: clone container, decompose the <strong> tags
-    import copy
-    from bs4 import NavigableString
-
-    container_clone = copy.copy(container)  # shallow copy
-    # Actually we want a deep copy so we can decompose
-    # Let's parse the container's HTML anew:
-    container_clone_soup = BeautifulSoup(str(container), "html.parser")
-    for st in container_clone_soup.find_all("strong"):
-        st.decompose()
-
-    # Now get text from the clone
-    raw_text = container_clone_soup.get_text(separator=" ", strip=True)
+        year_text = _text(strongs[-1])
+
+    # 2) We'll gather text from the container but *ignore* the <strong> tags,
+    #    so we don't double-count the year in the certificate_type.
+    #    The XPath filter does this in one pass — no need to clone the
+    #    subtree and delete nodes like the old code did.
+    raw_text = " ".join(_XP_NON_STRONG_TEXT(container))
     # e.g. "Club Certificate" or "Club  Certificate" with extra spaces
 
     # 3) Clean up the raw text: remove extra spaces, line breaks, etc.
     # Possibly "Club  Certificate" -> "Club Certificate".
-    # A simple approach is to split and re-join:
-    words = raw_text.split()
-    cert_type_text = " ".join(words)
+    cert_type_text = _WS_RE.sub(" ", raw_text).strip()
 
     return {
         "certificate_type": cert_type_text,
         "year": year_text
     }
 
-def parse_boat_name_and_sail(soup):
-    cert_divs = soup.find_all("div", class_="cert-type")
-    if len(cert_divs) < 2:
-        return None  # Not enough blocks
-    # The second block
-    boat_div = cert_divs[1]
-
-    strong_elem = boat_div.find("strong")
-    span_elem   = boat_div.find("span")
-    if strong_elem and span_elem:
+def parse_boat_name_and_sail(boat_div):
+    # `boat_div` is the *second* <div class="cert-type"> block
+    strongs = _XP_STRONGS(boat_div)
+    spans   = _XP_SPANS(boat_div)
+    if strongs and spans:
         return {
-            "boat_name": strong_elem.get_text(strip=True),
-            "sail_number": span_elem.get_text(strip=True),
+            "boat_name": _text(strongs[0]),
+            "sail_number": _text(spans[0]),
         }
     return None
 
-def parse_right_column(soup):
+def parse_right_column(right_col):
     """
     Parses the <div class="right-column"> section of the HTML, extracting:
       1) "summary_top" fields from <div class="tabular1"> (APH ToD, CDL, etc.)
       2) Each p1group block (BOAT, HULL, PROPELLER, etc.), capturing label/data pairs
          within <div class="tabular2/3/5">.
       3) A special fallback for the COMMENTS block (which may not have label/data pairs).
-    
+
     Returns a dict:
       {
         "summary_top": {
@@ -134,101 +359,70 @@ def parse_right_column(soup):
           ...
         ]
       }
-    or None if .right-column is not found.
     """
-    right_col = soup.find("div", class_="right-column")
-    if not right_col:
-        return None  # No right column at all
-
     # ------------------------------------------------
     # 1) Parse the top summary fields from <div class="tabular1">
     #    e.g. APH ToD: 466.3, CDL: 11.263, ...
     # ------------------------------------------------
     summary_top = {}
-    tabular1 = right_col.find("div", class_="tabular1")
-    if tabular1:
-        labels = tabular1.find_all("span", class_="small-label")
-        for lbl in labels:
-            label_text = lbl.get_text(strip=True).replace(":", "").strip()
-
-            # parent_span => <span class="number"> that wraps small-label
-            parent_span = lbl.find_parent("span", class_="number")
-            if not parent_span:
-                continue
-
-            # Next sibling might be <span class="data number"> or
-            # <span class="number"> <span class="data">someVal</span> </span>
-            next_el = parent_span.find_next_sibling("span")
-            if not next_el:
-                value_text = ""
-            else:
-                # Check the classes on next_el
-                classes = next_el.get("class") or []
-                if "data" in classes:
-                    # e.g. <span class="data number">someVal</span>
-                    value_text = next_el.get_text(strip=True)
-                elif "number" in classes:
-                    # e.g. <span class="number"><span class="data">70701</span></span>
-                    inner_data = next_el.find("span", class_="data")
-                    value_text = inner_data.get_text(strip=True) if inner_data else ""
-                else:
-                    # Some unexpected structure
-                    value_text = next_el.get_text(strip=True)
-
-            summary_top[label_text] = value_text
+    tabular1s = _XP_TABULAR1(right_col)
+    if tabular1s:
+        # The block alternates <span class="small-label"> and a value span
+        # carrying class "data" (either directly or nested inside a
+        # <span class="number"> wrapper — the XPath matches the data span
+        # itself in both cases). One query in document order gives
+        # label, value, label, value, ... so we just zip the pairs
+        # instead of doing a parent + sibling walk per label.
+        spans = _XP_SUMMARY_SPANS(tabular1s[0])
+        it = iter(spans)
+        for lbl, dat in zip(it, it):
+            label_text = _text(lbl).replace(":", "").strip()
+            summary_top[label_text] = _text(dat)
 
     # ------------------------------------------------
     # 2) Parse each <div class="p1group"> block
     #    We'll store them in a list => "groups"
     # ------------------------------------------------
     groups_data = []
-    p1_groups = right_col.find_all("div", class_="p1group", recursive=False)
-    # (If you need to catch nested p1group, remove recursive=False,
-    #  but typically they're siblings in your snippet.)
+    p1_groups = _XP_P1GROUPS(right_col)
+    # (The XPath only looks at direct children; if you ever need nested
+    #  p1group, switch "./div[...]" to ".//div[...]" — but typically
+    #  they're siblings in the ORC pages.)
     for group in p1_groups:
         # Each group may have <span class="title"> text
-        title_span = group.find("span", class_="title")
-        if title_span:
-            group_title = title_span.get_text(strip=True)
+        title_spans = _XP_TITLE_SPAN(group)
+        if title_spans:
+            group_title = _text(title_spans[0])
         else:
             # fallback
             group_title = "No title"
 
-        # Now find tabular2 / tabular3 / tabular5 inside
-        # We'll gather label/data pairs
-        # If there's no tabularX, it might be a "COMMENTS" block, etc.
-        tab_div = None
-        for possible_class in ["tabular2", "tabular3", "tabular5"]:
-            tab_div = group.find("div", class_=possible_class)
-            if tab_div:
-                break
+        # Now find tabular2 / tabular3 / tabular5 inside (one union query
+        # instead of up to three subtree searches). We'll gather
+        # label/data pairs; if there's no tabularX, it might be a
+        # "COMMENTS" block, etc.
+        hits = _XP_TABULAR_ANY(group)
+        tab_div = hits[0] if hits else None
 
         items = []
-        if tab_div:
+        if tab_div is not None:
             # Typical label/data pairs, e.g.
             #   <span class="label">Class</span><span class="data">Mat 11.80</span>
-            labels = tab_div.find_all("span", class_="label")
-            datas  = tab_div.find_all("span", class_="data")
+            labels = _XP_LABEL_SPANS(tab_div)
+            datas  = _XP_DATA_SPANS(tab_div)
 
             # Usually they line up in pairs
             for lbl, dat in zip(labels, datas):
-                label_text = lbl.get_text(strip=True)
-                value_text = dat.get_text(strip=True)
-                items.append({"label": label_text, "value": value_text})
+                items.append({"label": _text(lbl), "value": _text(dat)})
         else:
             # Possibly a block with free-text comments
             # If it's the "COMMENTS" block, let's just store each text line
             # in items under a single label "Comment".
-            # We can do something like:
-            text_spans = group.find_all("span", recursive=True)
-            # e.g. <span style="display:block;">IRC ENDORSED 2024</span>
-            # We'll gather them into one or more items:
-            # Check if there's any text in these spans that isn't label/data:
             big_text = []
-            for sp in text_spans:
-                # If it has class_ in ["label","data","title"], skip or handle differently
-                if not any(cls in ["label","data","title"] for cls in (sp.get("class") or [])):
-                    txt = sp.get_text(strip=True)
+            for sp in _XP_SPANS(group):
+                # If it has class in ["label","data","title"], skip
+                if not any(cls in ("label", "data", "title") for cls in _classes(sp)):
+                    txt = _text(sp)
                     if txt:
                         big_text.append(txt)
             if big_text:
@@ -247,64 +441,56 @@ def parse_right_column(soup):
         "groups": groups_data
     }
 
-def parse_boatspeeds_table(soup):
+def parse_boatspeeds_table(table):
     """
-    Finds the <table class="boatspeeds"> that contains:
+    Parses the <table class="boatspeeds"> that contains:
       - A "Wind Velocity" row (the first row)
       - Subsequent rows with class="data" (Beat Angles, Beat VMG, etc.)
 
-    Returns a dict like:
+    Returns the table in structure-of-arrays form:
       {
         "wind_speeds": ["4 kt", "6 kt", "8 kt", ...],
-        "rows": [
-          { "label": "Beat Angles", "values": ["42.9°", "42.9°", ...] },
-          { "label": "Beat VMG",    "values": ["3.06", "4.23", ...] },
-          ...
-        ]
+        "labels": ["Beat Angles", "Beat VMG", ...],
+        "matrix": <len(labels) x len(wind_speeds) float array>
       }
-    or None if not found.
+    (row i of "matrix" holds the numeric values for labels[i]; angle
+    cells lose their degree sign in the conversion)
+    or None if the table is malformed.
     """
-
-    # 1) Locate the table by class
-    table = soup.find("table", class_="boatspeeds")
-    if not table:
-        return None  # Not found
-
-    # 2) Grab all rows
-    rows = table.find_all("tr")
+    # 1) Grab all rows
+    rows = _XP_ROWS(table)
     if len(rows) < 2:
         # We expect at least one row for "Wind Velocity" and more for data
         return None
 
-    # 3) The first row has the wind speeds (plus the label "Wind Velocity")
-    header_cells = rows[0].find_all("td")
+    # 2) The first row has the wind speeds (plus the label "Wind Velocity")
+    header_cells = _XP_TDS(rows[0])
     if not header_cells:
         return None
     # skip the first cell which is "Wind Velocity"
-    wind_speeds = [td.get_text(strip=True) for td in header_cells[1:]]
-
-    data_rows = []
-    # 4) Each subsequent row is presumably class="data"
-    for row in rows[1:]:
-        if "data" not in (row.get("class") or []):
-            # skip if not data row
-            continue
-
-        cells = row.find_all("td")
+    wind_speeds = [_cell_text(td) for td in header_cells[1:]]
+
+    labels = []
+    value_rows = []
+    # 3) The data rows carry class="data"; let the compiled XPath pick
+    # them out in C instead of checking the class per row in Python
+    for row in _XP_DATA_ROWS(table):
+        cells = _XP_TDS(row)
         if not cells:
             continue
-        label = cells[0].get_text(strip=True)    # e.g. "Beat Angles", or "52°"
-        values = [c.get_text(strip=True) for c in cells[1:]]
-        data_rows.append({"label": label, "values": values})
+        labels.append(_cell_text(cells[0]))    # e.g. "Beat Angles", or "52°"
+        value_rows.append([_cell_text(c) for c in cells[1:]])
 
     return {
         "wind_speeds": wind_speeds,
-        "rows": data_rows
+        "labels": labels,
+        "matrix": _values_matrix(value_rows)
     }
 
-def parse_time_allowances_secsnm(soup):
+def parse_time_allowances_secsnm(table):
     """
-    Parses the <table class="allowances"> block that has <caption>Time Allowances in secs/NM</caption>.
+    Parses the <table class="allowances"> block whose caption is
+    "Time Allowances in secs/NM" (extract_all picks it out by caption).
     The table is structured like:
 
       <tr class="title">
@@ -334,89 +520,75 @@ def parse_time_allowances_secsnm(soup):
         <td>873.4</td><td>638.3</td>...
       </tr>
 
-    Returns:
+    Returns the table in structure-of-arrays form:
       {
         "wind_speeds": [...],
-        "rows": [ {"label":..., "values":[...]} , ... ],
-        "selected_courses": [ {"label":..., "values":[...]} , ... ]
+        "labels": [...],
+        "matrix": <len(labels) x len(wind_speeds) float array>,
+        "selected_courses": { "labels": [...], "matrix": <float array> }
       }
-    or None if not found.
+    or None if the table is malformed.
     """
-    # 1) Locate the table by searching for caption "Time Allowances in secs/NM"
-    table = None
-    candidate_tables = soup.find_all("table", class_="allowances")
-    for t in candidate_tables:
-        cap = t.find("caption")
-        if cap and "Time Allowances in secs/NM" in cap.get_text(strip=True):
-            table = t
-            break
-    if not table:
-        return None  # Not found
-
-    # 2) Grab all <tr> within this table
-    rows = table.find_all("tr")
+    # 1) Grab all <tr> within this table
+    rows = _XP_ROWS(table)
     if not rows:
         return None
 
-    # We'll store the results in three parts:
-    wind_speeds = []
-    main_rows = []
-    selected_courses = []
-
-    # 3) The first row with class="title" should contain Wind Velocity
+    # 2) The first row with class="title" should contain Wind Velocity
     #    and the columns for wind speeds
     #    e.g. <th>Wind Velocity</th><td>4 kt</td><td>6 kt</td>...
     wind_velocity_row = None
     i = 0
     for i, r in enumerate(rows):
-        row_classes = r.get("class", [])
-        if "title" in row_classes:
+        # rows in these tables carry a single class ("title"/"data"), so a
+        # plain attribute compare avoids building a token list per row
+        if r.get("class") == "title":
             # Check if there's "Wind Velocity" in the first TH
-            first_th = r.find("th")
-            if first_th and "Wind Velocity" in first_th.get_text(strip=True):
+            first_ths = _XP_THS(r)
+            if first_ths and "Wind Velocity" in _text(first_ths[0]):
                 wind_velocity_row = r
                 break
-    if not wind_velocity_row:
+    if wind_velocity_row is None:
         return None  # Didn't find the "Wind Velocity" row
 
     # from that row, skip the first cell (the <th> Wind Velocity)
-    velocity_cells = wind_velocity_row.find_all(["th", "td"])
-    wind_speeds = [cell.get_text(strip=True) for cell in velocity_cells[1:]]
+    velocity_cells = _XP_CELLS(wind_velocity_row)
+    wind_speeds = [_cell_text(cell) for cell in velocity_cells[1:]]
 
-    # 4) Now parse subsequent .data rows until we hit another .title row that says "Selected Courses"
-    main_data_rows = []
-    selected_courses_rows = []
-    in_selected_courses = False
+    # 3) Now parse subsequent .data rows until we hit another .title row that says "Selected Courses"
+    main_labels, main_values = [], []
+    sel_labels, sel_values = [], []
+    labels, values = main_labels, main_values
 
     for r in rows[i+1:]:
-        row_class = r.get("class", [])
-        if "title" in row_class:
+        row_class = r.get("class")
+        if row_class == "title":
             # check if it has "Selected Courses"
-            if "Selected Courses" in r.get_text(strip=True):
-                in_selected_courses = True
+            if "Selected Courses" in _text(r, sep=" "):
+                labels, values = sel_labels, sel_values
             continue
 
-        if "data" in row_class:
+        if row_class == "data":
             # Each data row: first cell is label, rest are values
-            cells = r.find_all(["th", "td"])
+            cells = _XP_CELLS(r)
             if len(cells) > 1:
-                label = cells[0].get_text(strip=True)
-                values = [c.get_text(strip=True) for c in cells[1:]]
-                if not in_selected_courses:
-                    main_data_rows.append({"label": label, "values": values})
-                else:
-                    selected_courses_rows.append({"label": label, "values": values})
+                labels.append(_cell_text(cells[0]))
+                values.append([_cell_text(c) for c in cells[1:]])
 
     # Return the structured result
     return {
         "wind_speeds": wind_speeds,
-        "rows": main_data_rows,
-        "selected_courses": selected_courses_rows
+        "labels": main_labels,
+        "matrix": _values_matrix(main_values),
+        "selected_courses": {
+            "labels": sel_labels,
+            "matrix": _values_matrix(sel_values),
+        }
     }
 
-def parse_single_number_scoring(soup):
+def parse_single_number_scoring(table):
     """
-    Finds the table <table class="allowances" id="singlenumber">, which has a caption
+    Parses the table <table class="allowances" id="singlenumber">, which has a caption
     'Single Number Scoring Options' and columns:
       - 'Course'
       - 'Time On Distance'
@@ -449,48 +621,41 @@ def parse_single_number_scoring(soup):
           { "label": "All purpose",        "values": ["466.3", "1.2866"] }
         ]
       }
-    or None if not found.
+    or None if the table is malformed.
     """
-    # Locate the table by id="singlenumber" or by searching for the caption
-    table = soup.find("table", class_="allowances", id="singlenumber")
-    if not table:
-        return None
-
     # Read the caption (if present)
-    cap_elem = table.find("caption")
-    caption_text = cap_elem.get_text(strip=True) if cap_elem else ""
+    caps = _XP_CAPTION(table)
+    caption_text = _text(caps[0]) if caps else ""
 
     # The first row with class="title" should define the columns
-    title_row = table.find("tr", class_="title")
-    if not title_row:
+    title_rows = _XP_TITLE_ROWS(table)
+    if not title_rows:
         return None
+    title_row = title_rows[0]
 
     # The first <th> is "Course". Skip it; the next ones are the scoring columns
-    headers = title_row.find_all("th")
+    headers = _XP_THS(title_row)
     if len(headers) < 2:
         return None
 
     # columns are from headers[1:] (skipping "Course")
     columns = []
     for h in headers[1:]:
-        # e.g. "Time OnDistance\nTime" from the <br>, we'll strip and maybe rejoin
-        col_text = h.get_text(separator=" ", strip=True)
-        columns.append(col_text)
+        # e.g. "Time On Distance" — the <br> becomes a space separator
+        columns.append(_text(h, sep=" "))
 
     # Now parse each row with class="data"
-    data_rows = table.find_all("tr", class_="data")
-
     rows_data = []
-    for row in data_rows:
-        cells = row.find_all(["th","td"])
+    for row in _XP_DATA_ROWS(table):
+        cells = _XP_CELLS(row)
         if len(cells) < 3:
             # at least 1 label + 2 values
             continue
 
         # The first cell is the label (e.g. "Windward / Leeward")
-        label = cells[0].get_text(strip=True)
+        label = _cell_text(cells[0])
         # The rest are the numeric values for columns
-        values = [c.get_text(strip=True) for c in cells[1:]]
+        values = [_cell_text(c) for c in cells[1:]]
 
         rows_data.append({
             "label": label,
@@ -504,41 +669,43 @@ def parse_single_number_scoring(soup):
     }
 
 
-def parse_boat_specs(soup: BeautifulSoup):
+def parse_boat_specs(groups):
     """
-    Extract boat specs from <div class="p2group"> sections.
-    Returns a list of dicts with keys: section_title, label, value.
+    Extract boat specs from the <div class="p2group"> sections collected
+    by extract_all. Returns a list of dicts with keys: section_title,
+    label, value.
     """
     data_list = []
-    p2groups = soup.find_all("div", class_="p2group")
-    for group in p2groups:
-        title_elem = group.find("span", class_="title")
-        section_title = title_elem.get_text(strip=True) if title_elem else "Unknown Section"
-
-        labels = group.find_all("span", class_="label")
-        datas  = group.find_all("span", class_="data")
-
-        for lbl, dat in zip(labels, datas):
+    for group in groups:
+        section_title = _XP_P2_TITLE(group).strip() or "Unknown Section"
+
+        # label and data spans come back interleaved in document order
+        # (label, value, label, value, ...), so pairing them is a
+        # pairwise zip over one flat element list — same pattern as the
+        # summary_top spans, and robust to empty value spans
+        spans = _XP_P2_PAIRS(group)
+        it = iter(spans)
+        for lbl, val in zip(it, it):
             data_list.append({
                 "section_title": section_title,
-                "label": lbl.get_text(strip=True),
-                "value": dat.get_text(strip=True)
+                "label": _text(lbl),
+                "value": _text(val)
             })
 
     return data_list
 """
 def parse_scoring_options(soup: BeautifulSoup):
-    
+
     Extract scoring options from each <div class="scoringparent">
     that contains <table class="allowances">.
-    
+
     Returns list[dict] with:
       {
         "country_id": "countryEST",
         "table_index": 0,
         "row_values": ["Triple Number Coastal/Long Distance Low", "585.4", "1.0250"]
       }
-    
+
     scoring_data = []
     scoring_parents = soup.find_all("div", class_="scoringparent")
     for parent in scoring_parents:
@@ -558,10 +725,10 @@ def parse_scoring_options(soup: BeautifulSoup):
     return scoring_data
 """
 
-def parse_sails(soup: BeautifulSoup):
+def parse_sails(groups):
     """
-    Extract sail data from each <div class="sailsGroup"> block.
-    We'll store each row as a dictionary keyed by column name:
+    Extract sail data from the <div class="sailsGroup"> blocks collected
+    by extract_all. We'll store each row as a dictionary keyed by column name:
     {
       "sail_type": "MAINSAIL",
       "entries": [
@@ -572,20 +739,20 @@ def parse_sails(soup: BeautifulSoup):
     """
     sails_info = []
 
-    sails_groups = soup.find_all("div", class_="sailsGroup")
-    for group in sails_groups:
-        title_elem = group.find("span", class_="title")
-        if not title_elem:
+    for group in groups:
+        title_spans = _XP_TITLE_SPAN(group)
+        if not title_spans:
             continue
-        sail_type = title_elem.get_text(strip=True)
+        sail_type = _text(title_spans[0])
 
-        tabular_div = group.find("div", class_="tabular")
-        if not tabular_div:
+        tabular_divs = _XP_TABULAR(group)
+        if not tabular_divs:
             # Might be style="display:none", so skip
             continue
+        tabular_div = tabular_divs[0]
 
         # Column headers
-        col_titles = [ct.get_text(strip=True) for ct in tabular_div.find_all("span", class_="coltitle")]
+        col_titles = [_text(ct) for ct in _XP_COLTITLES(tabular_div)]
         num_cols = len(col_titles)
 
         # If no columns found, skip or handle differently
@@ -598,19 +765,15 @@ def parse_sails(soup: BeautifulSoup):
             })
             continue
 
-        # Data cells
-        data_spans = tabular_div.find_all("span", class_="data")
-        rows_as_dicts = []
-        for i in range(0, len(data_spans), num_cols):
-            chunk = data_spans[i : i + num_cols]
-            if len(chunk) < num_cols:
-                break
-            row_dict = {}
-            for j, ds in enumerate(chunk):
-                key = col_titles[j]
-                value = ds.get_text(strip=True)
-                row_dict[key] = value
-            rows_as_dicts.append(row_dict)
+        # Data cells: pull all the text out in one go, then slice the flat
+        # list into rows of num_cols. dict(zip(...)) builds each row in C
+        # instead of the old cell-by-cell inner loop.
+        texts = [_cell_text(ds) for ds in _XP_DATA_SPANS(tabular_div)]
+        n_full = len(texts) - len(texts) % num_cols  # drop a trailing partial row
+        rows_as_dicts = [
+            dict(zip(col_titles, texts[i : i + num_cols]))
+            for i in range(0, n_full, num_cols)
+        ]
 
         sails_info.append({
             "sail_type": sail_type,
@@ -618,9 +781,9 @@ def parse_sails(soup: BeautifulSoup):
         })
 
     return sails_info
-""" 
+"""
 def parse_time_allowances(soup: BeautifulSoup):
-    
+
     Extract the "Time Allowances in secs/NM" table, often stored in a table with
     class="boatspeeds" (or similarly named). The rows might look like:
       <tr class="title"><th>Wind Velocity</th><th>4</th><th>6</th>...</tr>
@@ -629,7 +792,7 @@ def parse_time_allowances(soup: BeautifulSoup):
          <td windspeed="4">1230.3</td>
          <td windspeed="6">826.3</td> ...
       </tr>
-    
+
     We'll parse these into a structure like:
       {
         "wind_speeds": ["4", "6", "8", "10", "12", "14", ...],
@@ -643,7 +806,7 @@ def parse_time_allowances(soup: BeautifulSoup):
       }
 
     If there's more than one such table, adapt to parse them all or pick the first, etc.
-    
+
     # Try to find a table by class="boatspeeds"
     table = soup.find("table", class_="boatspeeds")
     if not table:
@@ -683,41 +846,89 @@ def parse_time_allowances(soup: BeautifulSoup):
         "rows": data_rows
     }
 """
-def main():
-    # 1) Fetch the HTML
-    url = "https://data.orc.org/public/WPub.dll/CC/168931"
-    html = fetch_html(url)
-
-    # 2) Parse with BeautifulSoup
-    soup = BeautifulSoup(html, "html.parser")
-
-    # 3) Extract data sets
-    certificate_type = parse_certificate_type(soup)
-    boatname_sailn = parse_boat_name_and_sail(soup)
-    right_column = parse_right_column(soup)
-    boatspeeds_table = parse_boatspeeds_table(soup)
-    time_allowances_table = parse_time_allowances_secsnm(soup)
-    single_number_scoring = parse_single_number_scoring(soup)
-    boat_specs = parse_boat_specs(soup)
-
-    #scoring_options = parse_scoring_options(soup)
-    sails_data      = parse_sails(soup)
-    #time_allowances = parse_time_allowances(soup)
-
-    # 4) Combine everything into a single JSON structure
-    orc_data = {
+def extract_all(tree):
+    """Locate every section of the certificate with ONE pass over the
+    document and dispatch each hit to its parser.
+
+    Each parse_* function used to open with its own full-tree scan, so
+    the same document was walked 7+ times. The union XPath returns all
+    interesting <div>/<table> elements in document order; we branch on
+    tag/class once per section and hand each parser just the subtree it
+    owns. Returns the combined orc_data dict (missing sections -> None,
+    matching the old behaviour).
+    """
+    certificate_type = None
+    boatname_sailn = None
+    right_column = None
+    boatspeeds_table = None
+    time_allowances_table = None
+    single_number_scoring = None
+    p2groups = []
+    sails_groups = []
+    cert_divs = []
+
+    for el in _XP_SECTIONS(tree):
+        classes = _classes(el)
+        if el.tag == "table":
+            if "boatspeeds" in classes:
+                if boatspeeds_table is None:
+                    boatspeeds_table = parse_boatspeeds_table(el)
+            elif el.get("id") == "singlenumber":
+                if single_number_scoring is None:
+                    single_number_scoring = parse_single_number_scoring(el)
+            elif time_allowances_table is None:
+                # the secs/NM table is recognised by its caption
+                caps = _XP_CAPTION(el)
+                if caps and "Time Allowances in secs/NM" in _text(caps[0]):
+                    time_allowances_table = parse_time_allowances_secsnm(el)
+        else:  # div
+            if "cert-type" in classes:
+                # first block: certificate type + year; second: boat name + sail no
+                cert_divs.append(el)
+            elif "right-column" in classes:
+                if right_column is None:
+                    right_column = parse_right_column(el)
+            elif "p2group" in classes:
+                p2groups.append(el)
+            elif "sailsGroup" in classes:
+                sails_groups.append(el)
+
+    if cert_divs:
+        fingerprint = _header_fingerprint(cert_divs[0])
+        if fingerprint is not None:
+            # straight-line extractor generated for this exact layout
+            extract_header = _header_extractor(fingerprint)
+            certificate_type, boatname_sailn = extract_header(
+                cert_divs[0], cert_divs[1] if len(cert_divs) > 1 else None)
+        else:
+            # unknown layout: take the generic branching path
+            certificate_type = parse_certificate_type(cert_divs[0])
+            if len(cert_divs) > 1:
+                boatname_sailn = parse_boat_name_and_sail(cert_divs[1])
+
+    return {
         "certificate_type": certificate_type,
         "boatname_sailn" : boatname_sailn,
         "right_column": right_column,
         "boatspeeds_table": boatspeeds_table,
         "time_allowances_table": time_allowances_table,
         "single_number_scoring": single_number_scoring,
-        "boat_specs": boat_specs,
-        #"scoring_options": scoring_options,
-        "sails": sails_data,
-        #"time_allowances": time_allowances
+        "boat_specs": parse_boat_specs(p2groups),
+        "sails": parse_sails(sails_groups),
     }
 
+
+def process_one(cert_id):
+    """Fetch and parse one certificate; returns (filename, orc_data)."""
+    # 1) + 2) Fetch and parse in one streaming step
+    url = BASE_URL.format(cert_id=cert_id)
+    tree = fetch_tree(url)
+
+    # 3) Extract every data set in a single walk over the tree
+    orc_data = extract_all(tree)
+    certificate_type = orc_data["certificate_type"]
+    boatname_sailn = orc_data["boatname_sailn"]
+
         # -- Construct the desired file name --
     # 1) Get boat name (fall back if not found)
     if boatname_sailn and "boat_name" in boatname_sailn:
@@ -740,22 +951,43 @@ def main():
     # 4) Create the final filename
     filename = f"orc_certificate_{boat_name_safe}_{year}_{cert_type_safe}.json"
 
+    return filename, orc_data
+
+
+def _write_json(save_path, data):
+    """Write `data` to `save_path` as indented UTF-8 JSON.
+
+    orjson serializes in C and emits non-ASCII characters directly
+    (matching the old ensure_ascii=False); stdlib json produces the
+    same file when orjson isn't installed. The numpy matrices in the
+    parsed tables only become Python lists here, at the dump boundary.
+    """
+    if orjson is not None:
+        with open(save_path, "wb") as f:
+            f.write(orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(save_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2,
+                      default=lambda o: o.tolist())
+
+
+def main(cert_ids):
+    """Scrape every certificate id in `cert_ids` and write one JSON each.
+
+    Fetching is network-bound and lxml releases the GIL while parsing,
+    so a thread pool over the shared session scales close to linearly.
+    """
     # -- Ensure we write into the "JSON_certificates" subfolder --
     os.makedirs("JSON_certificates", exist_ok=True)  # creates folder if missing
-    save_path = os.path.join("JSON_certificates", filename)
 
-    # 5) Write out the JSON file
-    with open(save_path, "w", encoding="utf-8") as f:
-        json.dump(orc_data, f, ensure_ascii=False, indent=2)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as ex:
+        for filename, orc_data in ex.map(process_one, cert_ids):
+            save_path = os.path.join("JSON_certificates", filename)
+            _write_json(save_path, orc_data)
+            print(f"Done! Your JSON is saved at: {save_path}")
 
-    print(f"Done! Your JSON is saved at: c:/Users/nadir/OneDrive/Desktop/ORC data scraper/JSON_certificates")
 
-"""
-    # 5) Write it out to a JSON file
-    with open("orc_certificate_data.json", "w", encoding="utf-8") as f:
-        json.dump(orc_data, f, ensure_ascii=False, indent=2)
-
-    print("Done! Check 'orc_certificate_data.json' in the current directory.")
-"""
 if __name__ == "__main__":
-    main()
+    # e.g.  python "import requests.py" 168931 168932 168933
+    main(sys.argv[1:] or ["168931"])